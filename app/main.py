@@ -1,12 +1,24 @@
+import asyncio
+import hashlib
 import logging
 import os
-from fastapi import FastAPI, Request, Form
-from fastapi.responses import RedirectResponse, JSONResponse
+import re
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Literal
+
+import jinja2
+import orjson
+from fastapi import FastAPI, Request, Form, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, RedirectResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from .sf import (
     get_salesforce_client,
+    close_salesforce_client,
     list_report_folders,
     list_dashboard_folders,
     list_dashboards_in_folder,
@@ -16,6 +28,7 @@ from .sf import (
     prepare_report_copy,
     prepare_selected_reports_copy,
     prepare_dashboard_copy,
+    get_artifact_path,
     start_deploy,
     get_deploy_status,
 )
@@ -26,23 +39,97 @@ logging.basicConfig(
     level=LOG_LEVEL,
     format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
 )
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Log in once at startup so the first request reuses a warm, pooled session
+    try:
+        await run_in_threadpool(get_salesforce_client)
+    except Exception as exc:
+        logger.warning("Salesforce client not initialized at startup: %s", exc)
+    # Compile templates now rather than on the first request that renders them
+    for name in ("index.html", "review.html", "deploy_progress.html"):
+        templates.get_template(name)
+    yield
+    close_salesforce_client()
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache assets instead of refetching them per page."""
+
+    # e.g. app.3f2a9c1d.css: content-addressed, safe to cache forever
+    _fingerprinted = re.compile(r"\.[0-9a-f]{8,}\.\w+$")
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if self._fingerprinted.search(str(full_path)):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            # ETag/Last-Modified still let the browser revalidate cheaply
+            response.headers["Cache-Control"] = "public, max-age=300, stale-while-revalidate=86400"
+        return response
+
+
+app = FastAPI(title="SF Reports & Dashboards Copier", lifespan=lifespan)
+# Folder/report listings and rendered pages are highly compressible
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+app.mount("/static", CachedStaticFiles(directory="static"), name="static")
+# Templates ship with the image; skip the per-render mtime check
+templates = Jinja2Templates(
+    env=jinja2.Environment(
+        loader=jinja2.FileSystemLoader("templates"),
+        autoescape=True,
+        auto_reload=False,
+    )
+)
+templates.env.filters["basename"] = os.path.basename
+
+
+def _settle(results: list) -> tuple[list, str | None]:
+    """Replace failed gather() results with [] and join their messages for the error banner."""
+    values = [[] if isinstance(r, Exception) else r for r in results]
+    errors = [str(r) for r in results if isinstance(r, Exception)]
+    return values, "; ".join(errors) or None
+
 
-app = FastAPI(title="SF Reports & Dashboards Copier")
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    tags = (t.strip().removeprefix("W/") for t in if_none_match.split(","))
+    return any(t == etag or t == "*" for t in tags)
 
-app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+
+def _encode_with_etag(payload) -> tuple[bytes, str]:
+    body = orjson.dumps(payload)
+    return body, '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+def _etag_response(request: Request, body: bytes, etag: str) -> Response:
+    """JSON response carrying etag; answers 304 if the client already has it."""
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def _json_with_etag(request: Request, payload) -> Response:
+    return _etag_response(request, *_encode_with_etag(payload))
+
+
+# kind -> (folder rows, body, etag); reused for as long as the sf cache hands back the same rows
+_FOLDER_PAYLOADS: dict[str, tuple[list, bytes, str]] = {}
 
 
 @app.get("/")
-def index(request: Request):
-    try:
-        report_folders = list_report_folders()
-        dashboard_folders = list_dashboard_folders()
-        error_message = None
-    except Exception as exc:  # minimal UX: show error banner
-        report_folders = []
-        dashboard_folders = []
-        error_message = str(exc)
+async def index(request: Request):
+    # Independent Salesforce round trips: run them concurrently, keep whichever succeeded
+    results = await asyncio.gather(
+        run_in_threadpool(list_report_folders),
+        run_in_threadpool(list_dashboard_folders),
+        return_exceptions=True,
+    )
+    (report_folders, dashboard_folders), error_message = _settle(results)
     return templates.TemplateResponse(
         "index.html",
         {
@@ -56,10 +143,14 @@ def index(request: Request):
 
 
 @app.get("/dashboards")
-def dashboards_by_folder(request: Request, folder_id: str):
-    report_folders = list_report_folders()
-    dashboard_folders = list_dashboard_folders()
-    dashboards = list_dashboards_in_folder(folder_id)
+async def dashboards_by_folder(request: Request, folder_id: str):
+    results = await asyncio.gather(
+        run_in_threadpool(list_report_folders),
+        run_in_threadpool(list_dashboard_folders),
+        run_in_threadpool(list_dashboards_in_folder, folder_id),
+        return_exceptions=True,
+    )
+    (report_folders, dashboard_folders, dashboards), error_message = _settle(results)
     return templates.TemplateResponse(
         "index.html",
         {
@@ -68,45 +159,51 @@ def dashboards_by_folder(request: Request, folder_id: str):
             "dashboard_folders": dashboard_folders,
             "dashboards": dashboards,
             "selected_dashboard_folder_id": folder_id,
+            "error_message": error_message,
         },
     )
 
 
 # JSON API endpoints for browser tables
 @app.get("/api/reports")
-def api_list_reports(folder_id: str):
+async def api_list_reports(
+    request: Request,
+    folder_id: str,
+    limit: int | None = Query(default=None, ge=1, le=2000),
+    # SOQL caps OFFSET at 2000
+    offset: int = Query(default=0, ge=0, le=2000),
+):
     try:
-        items = list_reports_in_folder(folder_id)
-        return JSONResponse(items)
+        items = await run_in_threadpool(list_reports_in_folder, folder_id, limit, offset)
+        return _json_with_etag(request, items)
     except Exception as exc:
-        logging.exception("Failed to list reports for folder %s", folder_id)
+        logger.exception("Failed to list reports for folder %s", folder_id)
         return JSONResponse({"error": str(exc)}, status_code=500)
 
 
 @app.get("/api/dashboards")
-def api_list_dashboards(folder_id: str):
+async def api_list_dashboards(request: Request, folder_id: str):
     try:
-        items = list_dashboards_in_folder(folder_id)
-        return JSONResponse(items)
+        items = await run_in_threadpool(list_dashboards_in_folder, folder_id)
+        return _json_with_etag(request, items)
     except Exception as exc:
-        logging.exception("Failed to list dashboards for folder %s", folder_id)
+        logger.exception("Failed to list dashboards for folder %s", folder_id)
         return JSONResponse({"error": str(exc)}, status_code=500)
 
 
 @app.get("/api/folders")
-def api_list_folders(kind: str):
+async def api_list_folders(request: Request, kind: Literal["report", "dashboard"], cached: bool = True):
+    # Any other kind is rejected with a 422 by FastAPI before this runs
+    lister = list_report_folders if kind == "report" else list_dashboard_folders
     try:
-        if kind == "report":
-            items = list_report_folders()
-        elif kind == "dashboard":
-            items = list_dashboard_folders()
-        else:
-            return JSONResponse({"error": "invalid_kind"}, status_code=400)
-        # Normalize shape
-        out = [{"Id": f.get("Id"), "Name": f.get("Name"), "DeveloperName": f.get("DeveloperName")} for f in items or []]
-        return JSONResponse(out)
+        items = await run_in_threadpool(lister, cached)
+        # Rows are already normalized by the sf layer; serialize once per cache refresh
+        payload = _FOLDER_PAYLOADS.get(kind)
+        if payload is None or payload[0] is not items:
+            payload = _FOLDER_PAYLOADS[kind] = (items, *_encode_with_etag(items))
+        return _etag_response(request, payload[1], payload[2])
     except Exception as exc:
-        logging.exception("Failed to list folders for kind %s", kind)
+        logger.exception("Failed to list folders for kind %s", kind)
         return JSONResponse({"error": str(exc)}, status_code=500)
 
 
@@ -133,87 +230,76 @@ def post_copy_dashboard(
 
 
 # New prepare endpoints
-@app.post("/prepare/report-folder")
-def prepare_report_folder(request: Request, source_folder_id: str = Form(...), target_folder_name: str = Form(...)):
-    data = prepare_report_copy(source_folder_id=source_folder_id, target_folder_name=target_folder_name)
-    report_folders = list_report_folders()
-    dashboard_folders = list_dashboard_folders()
+async def _render_review(request: Request, kind: str, prepare) -> Response:
+    """Build the package off the event loop, then render review.html."""
+    data = await run_in_threadpool(prepare)
     return templates.TemplateResponse(
         "review.html",
         {
             "request": request,
-            "kind": "report",
-            "members": data.get("members", []),
-            "package_xml": data.get("package_xml", ""),
-            "zip_path": data.get("zip_path", ""),
-            "target_folder_devname": data.get("target_folder_devname", ""),
-            "report_folders": report_folders,
-            "dashboard_folders": dashboard_folders,
+            "kind": kind,
+            **data,
         },
     )
 
 
+@app.post("/prepare/report-folder")
+async def prepare_report_folder(request: Request, source_folder_id: str = Form(...), target_folder_name: str = Form(...)):
+    return await _render_review(
+        request,
+        "report",
+        partial(prepare_report_copy, source_folder_id=source_folder_id, target_folder_name=target_folder_name),
+    )
+
+
 @app.post("/prepare/reports-selected")
-def prepare_reports_selected(
+async def prepare_reports_selected(
     request: Request,
     source_folder_id: str = Form(...),
     target_folder_name: str = Form(...),
     report_ids: list[str] = Form(default=[]),
 ):
-    data = prepare_selected_reports_copy(
-        source_folder_id=source_folder_id,
-        selected_report_ids=report_ids,
-        target_folder_name=target_folder_name,
-    )
-    report_folders = list_report_folders()
-    dashboard_folders = list_dashboard_folders()
-    return templates.TemplateResponse(
-        "review.html",
-        {
-            "request": request,
-            "kind": "report",
-            "members": data.get("members", []),
-            "package_xml": data.get("package_xml", ""),
-            "zip_path": data.get("zip_path", ""),
-            "target_folder_devname": data.get("target_folder_devname", ""),
-            "report_folders": report_folders,
-            "dashboard_folders": dashboard_folders,
-        },
+    return await _render_review(
+        request,
+        "report",
+        partial(
+            prepare_selected_reports_copy,
+            source_folder_id=source_folder_id,
+            selected_report_ids=report_ids,
+            target_folder_name=target_folder_name,
+        ),
     )
 
 
 @app.post("/prepare/dashboard")
-def prepare_dashboard(request: Request,
+async def prepare_dashboard(request: Request,
     dashboard_folder_id: str = Form(...),
     dashboard_developer_name: str = Form(...),
     target_dashboard_folder_name: str = Form(...),
     target_report_folder_name: str = Form(...),
 ):
-    data = prepare_dashboard_copy(
-        source_dashboard_folder_id=dashboard_folder_id,
-        source_dashboard_developer_name=dashboard_developer_name,
-        target_dashboard_folder_name=target_dashboard_folder_name,
-        target_report_folder_name=target_report_folder_name,
-    )
-    report_folders = list_report_folders()
-    dashboard_folders = list_dashboard_folders()
-    return templates.TemplateResponse(
-        "review.html",
-        {
-            "request": request,
-            "kind": "dashboard",
-            "members_reports": data.get("members_reports", []),
-            "member_dashboard": data.get("member_dashboard", ""),
-            "package_xml": data.get("package_xml", ""),
-            "zip_path": data.get("zip_path", ""),
-            "target_dashboard_devname": data.get("target_dashboard_devname", ""),
-            "target_report_devname": data.get("target_report_devname", ""),
-            "report_folders": report_folders,
-            "dashboard_folders": dashboard_folders,
-        },
+    return await _render_review(
+        request,
+        "dashboard",
+        partial(
+            prepare_dashboard_copy,
+            source_dashboard_folder_id=dashboard_folder_id,
+            source_dashboard_developer_name=dashboard_developer_name,
+            target_dashboard_folder_name=target_dashboard_folder_name,
+            target_report_folder_name=target_report_folder_name,
+        ),
     )
 
 
+@app.get("/artifacts/{name}")
+def download_artifact(name: str):
+    path = get_artifact_path(name)
+    if path is None:
+        return JSONResponse({"error": "artifact_not_found"}, status_code=404)
+    # FileResponse streams from disk in chunks instead of buffering the zip
+    return FileResponse(path, media_type="application/zip", filename=name)
+
+
 # Deploy endpoints
 @app.post("/deploy/start")
 def deploy_start(request: Request, zip_path: str = Form(...)):
@@ -224,8 +310,77 @@ def deploy_start(request: Request, zip_path: str = Form(...)):
     )
 
 
+# One Salesforce poller per deploy job, fanned out to every open status stream
+DEPLOY_POLL_SECONDS = 2
+# How long a finished job's last status is kept for late or reconnecting streams
+DEPLOY_STATUS_GRACE_SECONDS = 60
+_DEPLOY_SUBSCRIBERS: dict[str, set[asyncio.Queue]] = {}
+_DEPLOY_POLLERS: dict[str, asyncio.Task] = {}
+_DEPLOY_LAST_STATUS: dict[str, dict] = {}
+
+
+def _is_final_deploy_status(status: dict) -> bool:
+    state = status.get("status")
+    return (
+        "error" in status
+        or status.get("done") is True
+        or (isinstance(state, str) and state.lower() in ("succeeded", "failed", "canceled", "completed"))
+    )
+
+
+async def _poll_deploy(job_id: str) -> None:
+    try:
+        while _DEPLOY_SUBSCRIBERS.get(job_id):
+            try:
+                status = await run_in_threadpool(get_deploy_status, job_id)
+            except Exception:
+                logger.exception("Failed to poll deploy status for job %s", job_id)
+            else:
+                _DEPLOY_LAST_STATUS[job_id] = status
+                for queue in _DEPLOY_SUBSCRIBERS.get(job_id, ()):
+                    queue.put_nowait(status)
+                if _is_final_deploy_status(status):
+                    break
+            await asyncio.sleep(DEPLOY_POLL_SECONDS)
+    finally:
+        _DEPLOY_POLLERS.pop(job_id, None)
+        # The last status only serves replays; drop it once streams have had time to pick it up
+        asyncio.get_running_loop().call_later(
+            DEPLOY_STATUS_GRACE_SECONDS, _DEPLOY_LAST_STATUS.pop, job_id, None
+        )
+
+
+async def _deploy_events(job_id: str):
+    queue: asyncio.Queue = asyncio.Queue()
+    _DEPLOY_SUBSCRIBERS.setdefault(job_id, set()).add(queue)
+    last = _DEPLOY_LAST_STATUS.get(job_id)
+    if last is not None:
+        queue.put_nowait(last)
+    if job_id not in _DEPLOY_POLLERS and not (last and _is_final_deploy_status(last)):
+        _DEPLOY_POLLERS[job_id] = asyncio.create_task(_poll_deploy(job_id))
+    try:
+        while True:
+            status = await queue.get()
+            yield b"data: " + orjson.dumps(status) + b"\n\n"
+            if _is_final_deploy_status(status):
+                break
+    finally:
+        subscribers = _DEPLOY_SUBSCRIBERS.get(job_id)
+        if subscribers is not None:
+            subscribers.discard(queue)
+            if not subscribers:
+                del _DEPLOY_SUBSCRIBERS[job_id]
+
+
 @app.get("/deploy/status")
-def deploy_status(job_id: str):
-    return get_deploy_status(job_id)
+async def deploy_status(request: Request, job_id: str):
+    # EventSource clients get a push stream; plain requests still get a one-off JSON snapshot
+    if "text/event-stream" in request.headers.get("accept", ""):
+        return StreamingResponse(
+            _deploy_events(job_id),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+    return await run_in_threadpool(get_deploy_status, job_id)
 
 
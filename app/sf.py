@@ -1,29 +1,105 @@
 import os
 import logging
+import random
+import re
+import shutil
+import struct
+import threading
+import time
 import uuid
 import tempfile
 import zipfile
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BytesIO
-from typing import Dict, List, Tuple, Set
+from operator import itemgetter
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Tuple, Set, TypedDict
 
 from dotenv import load_dotenv
 
-# salesforce_api provides both data APIs and metadata deploy/retrieve
-from salesforce_api import Salesforce
-from salesforce_api.models.shared import Type as SfType
+if TYPE_CHECKING:
+    # salesforce_api provides both data APIs and metadata deploy/retrieve; it is imported
+    # on first use so worker start-up doesn't pay for it
+    from salesforce_api import Salesforce
+    import requests
 
 
 logger = logging.getLogger(__name__)
 
-_SF_CLIENT: Salesforce | None = None
-_DEPLOY_JOBS: Dict[str, object] = {}
 
+@dataclass
+class RepackResult:
+    """A repacked deploy package plus what it contains, so callers needn't reopen it."""
 
-def get_salesforce_client() -> Salesforce:
+    zip_bytes: BinaryIO
+    members: List[str]
+    package_xml: str
+    # Dashboard+reports packages only: Folder/DeveloperName of the dashboard
+    dashboard: str = ""
+
+
+class FolderOut(TypedDict):
+    Id: str | None
+    Name: str | None
+    DeveloperName: str | None
+
+
+_SF_CLIENT: "Salesforce | None" = None
+_SF_CLIENT_LOCK = threading.Lock()
+_DEPLOY_JOBS: Dict[str, Future] = {}
+# Deploy submissions (base64 upload + deploy call) run here, off the request path
+_DEPLOY_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sf-deploy")
+# Bursts of status polls (tabs, reconnects) collapse to one checkDeployStatus call
+_DEPLOY_STATUS_TTL_SECONDS = 2
+_DEPLOY_STATUS_CACHE: Dict[str, Tuple[float, Dict[str, object]]] = {}
+# Prepared packages are written to the temp dir under this prefix
+_ARTIFACT_PREFIX = "sfcopy_"
+
+# Folder listings change rarely; keep the combined Report/Dashboard listing for a few minutes
+_FOLDER_LIST_TTL_SECONDS = 300
+_FOLDER_LIST_CACHE: Dict[str, Tuple[float, Dict[str, List[FolderOut]]]] = {}
+_FOLDER_LIST_LOCK = threading.Lock()
+# Bumped on every invalidation, so a listing queried before a folder insert is never cached
+_FOLDER_LIST_GENERATION = 0
+
+# Every folder per type (by Name, plus all DeveloperNames), for find-or-create of target folders
+_FOLDER_INDEX_TTL_SECONDS = 30
+_FOLDER_INDEX_CACHE: Dict[str, Tuple[float, Dict[str, Tuple[str, str]], Set[str]]] = {}
+
+# Report Id -> DeveloperName, so re-preparing or copying the same selection skips the SOQL
+_REPORT_DEVNAME_TTL_SECONDS = 300
+_REPORT_DEVNAME_CACHE: Dict[str, Tuple[float, str]] = {}
+
+# Folder Id -> (DeveloperName, Name); short-lived so a folder renamed in Salesforce is picked up
+_FOLDER_BY_ID_TTL_SECONDS = 60
+_FOLDER_BY_ID_CACHE: Dict[str, Tuple[float, Tuple[str, str]]] = {}
+
+# Dashboard fullname -> report fullnames it referenced when last retrieved
+_DASHBOARD_REFS_TTL_SECONDS = 600
+_DASHBOARD_REFS_CACHE: Dict[str, Tuple[float, List[str]]] = {}
+
+# Calls currently running, so concurrent identical requests share one round trip
+_INFLIGHT: Dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def get_salesforce_client() -> "Salesforce":
     global _SF_CLIENT
-    if _SF_CLIENT is not None:
+    client = _SF_CLIENT
+    if client is not None:
+        return client
+    # Concurrent first requests would each log in; only one thread builds the client
+    with _SF_CLIENT_LOCK:
+        if _SF_CLIENT is None:
+            _SF_CLIENT = _build_salesforce_client()
         return _SF_CLIENT
 
+
+def _build_salesforce_client() -> "Salesforce":
+    from salesforce_api import Salesforce
+
     load_dotenv()
 
     username = os.getenv("SF_USERNAME")
@@ -47,6 +123,8 @@ def get_salesforce_client() -> Salesforce:
         client_kwargs["is_sandbox"] = is_sandbox
     if api_version:
         client_kwargs["api_version"] = api_version
+    # Own the HTTP session so its connection pool lives (and is closed) with the app
+    client_kwargs["session"] = _new_http_session()
 
     logger.debug(
         "Initializing Salesforce client (domain=%s, is_sandbox=%s, api_version=%s)",
@@ -54,42 +132,146 @@ def get_salesforce_client() -> Salesforce:
         client_kwargs.get("is_sandbox"),
         client_kwargs.get("api_version"),
     )
-    _SF_CLIENT = Salesforce(**client_kwargs)
-    return _SF_CLIENT
+    return Salesforce(**client_kwargs)
 
 
-def list_report_folders() -> List[Dict[str, str]]:
+def _sf_type(name: str, members: List[str]):
+    from salesforce_api.models.shared import Type as SfType
+    return SfType(name, members)
+
+
+def _new_http_session() -> "requests.Session":
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # Keep-alive pool sized for the parallel retrieve/list calls; Retry's defaults only
+    # retry idempotent methods, so inserts and deploys are never sent twice
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def close_salesforce_client() -> None:
+    """Drop the cached client and close its pooled HTTP connections."""
+    global _SF_CLIENT
+    with _SF_CLIENT_LOCK:
+        client, _SF_CLIENT = _SF_CLIENT, None
+    if client is not None:
+        client.connection.session.close()
+
+
+_FOLDER_FIELDS = ("Id", "Name", "DeveloperName")
+_folder_fields = itemgetter(*_FOLDER_FIELDS)
+
+
+def _normalize_folders(rows) -> List[FolderOut]:
+    # Done once per cache refresh so API responses can reuse the rows as-is
+    return [dict(zip(_FOLDER_FIELDS, _folder_fields(r))) for r in rows or ()]
+
+
+def _single_flight(key: str, fn):
+    """Run fn once for all concurrent callers of key; followers wait for the leader's result."""
+    with _INFLIGHT_LOCK:
+        fut = _INFLIGHT.get(key)
+        leader = fut is None
+        if leader:
+            fut = _INFLIGHT[key] = Future()
+    if not leader:
+        return fut.result()
+    try:
+        result = fn()
+    except BaseException as exc:
+        fut.set_exception(exc)
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+
+def list_all_folders(use_cache: bool = True) -> Dict[str, List[FolderOut]]:
+    """Report and Dashboard folders from a single SOQL, keyed by folder Type."""
+    now = time.monotonic()
+    with _FOLDER_LIST_LOCK:
+        generation = _FOLDER_LIST_GENERATION
+        hit = _FOLDER_LIST_CACHE.get("all") if use_cache else None
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    folders = _single_flight(f"folders:all:{generation}", _query_all_folders)
+    with _FOLDER_LIST_LOCK:
+        if generation == _FOLDER_LIST_GENERATION:
+            _FOLDER_LIST_CACHE["all"] = (now + _FOLDER_LIST_TTL_SECONDS, folders)
+    return folders
+
+
+def invalidate_folder_lists() -> None:
+    global _FOLDER_LIST_GENERATION
+    with _FOLDER_LIST_LOCK:
+        _FOLDER_LIST_GENERATION += 1
+        _FOLDER_LIST_CACHE.clear()
+
+
+def list_report_folders(use_cache: bool = True) -> List[FolderOut]:
+    return list_all_folders(use_cache)["Report"]
+
+
+def list_dashboard_folders(use_cache: bool = True) -> List[FolderOut]:
+    return list_all_folders(use_cache)["Dashboard"]
+
+
+def _query_all_folders() -> Dict[str, List[FolderOut]]:
     sf = get_salesforce_client()
-    soql = "SELECT Id, Name, DeveloperName FROM Folder WHERE Type = 'Report' ORDER BY Name"
+    soql = (
+        "SELECT Id, Name, DeveloperName, Type FROM Folder "
+        "WHERE Type IN ('Report', 'Dashboard') ORDER BY Name"
+    )
     res = sf.sobjects.query(soql)
-    # Filter out folders with null or literal "(null)" names
-    filtered = []
+    report_rows = []
+    dashboard_rows = []
     for r in res or []:
-        name = r.get("Name")
-        dev = r.get("DeveloperName")
-        if not name:
-            continue
-        if isinstance(name, str) and name.strip().lower() == "(null)":
-            continue
-        # Also skip if DeveloperName is missing (not actionable)
-        if not dev:
-            continue
-        filtered.append(r)
-    return filtered  # library returns list-like per docs
+        folder_type = r.get("Type")
+        if folder_type == "Dashboard":
+            dashboard_rows.append(r)
+        elif folder_type == "Report" and _is_listable_report_folder(r):
+            report_rows.append(r)
+    return {
+        "Report": _normalize_folders(report_rows),
+        "Dashboard": _normalize_folders(dashboard_rows),
+    }
 
 
-def list_dashboard_folders() -> List[Dict[str, str]]:
-    sf = get_salesforce_client()
-    soql = "SELECT Id, Name, DeveloperName FROM Folder WHERE Type = 'Dashboard' ORDER BY Name"
-    res = sf.sobjects.query(soql)
-    return res
+def _is_listable_report_folder(r) -> bool:
+    # Filter out folders with null or literal "(null)" names
+    name = r.get("Name")
+    if not name:
+        return False
+    if isinstance(name, str) and name.strip().lower() == "(null)":
+        return False
+    # Also skip if DeveloperName is missing (not actionable)
+    return bool(r.get("DeveloperName"))
+
+
+_SOQL_ESCAPE = str.maketrans({"'": "\\'", "\\": "\\\\"})
+
+
+def _soql_str(value: str) -> str:
+    """Escape value for use inside a single-quoted SOQL string literal."""
+    return value.translate(_SOQL_ESCAPE)
 
 
 def list_dashboards_in_folder(folder_id: str) -> List[Dict[str, str]]:
     # Use SOQL to list dashboards by Folder Name
     _, folder_name = _get_folder_devname_by_id(folder_id)
     sf = get_salesforce_client()
-    safe_name = folder_name.replace("'", "\\'")
+    safe_name = _soql_str(folder_name)
     soql = (
         "SELECT Id, DeveloperName, Title FROM Dashboard WHERE FolderName = '"
         + safe_name
@@ -106,17 +288,22 @@ def list_dashboards_in_folder(folder_id: str) -> List[Dict[str, str]]:
     return dashboards
 
 
-def list_reports_in_folder(folder_id: str) -> List[Dict[str, str]]:
+def list_reports_in_folder(folder_id: str, limit: int | None = None, offset: int = 0) -> List[Dict[str, str]]:
     """Public wrapper to list reports in a given folder by Id.
 
-    Returns items with keys: Id, name, developerName
+    Returns items with keys: Id, name, developerName. limit/offset page through the
+    folder (ordered by Name); without a limit the whole folder is returned.
     """
-    return _list_folder_items(folder_id, "Report")
+    return _list_folder_items(folder_id, "Report", limit=limit, offset=offset)
 
 
 def _get_folder_devname_by_id(folder_id: str) -> Tuple[str, str]:
+    now = time.monotonic()
+    hit = _FOLDER_BY_ID_CACHE.get(folder_id)
+    if hit is not None and hit[0] > now:
+        return hit[1]
     sf = get_salesforce_client()
-    soql = f"SELECT Id, Name, DeveloperName FROM Folder WHERE Id = '{folder_id}'"
+    soql = f"SELECT Id, Name, DeveloperName FROM Folder WHERE Id = '{_soql_str(folder_id)}'"
     res = sf.sobjects.query(soql)
     if not res:
         raise RuntimeError("Folder not found")
@@ -127,32 +314,29 @@ def _get_folder_devname_by_id(folder_id: str) -> Tuple[str, str]:
         row["DeveloperName"],
         row["Name"],
     )
-    return row["DeveloperName"], row["Name"]
+    names = (row["DeveloperName"], row["Name"])
+    _FOLDER_BY_ID_CACHE[folder_id] = (now + _FOLDER_BY_ID_TTL_SECONDS, names)
+    return names
+
 
+def invalidate_folder_cache() -> None:
+    _FOLDER_BY_ID_CACHE.clear()
 
-def _ensure_report_folder_exists(target_folder_name: str) -> str:
+
+def _ensure_report_folder_exists(target_folder_name: str) -> Tuple[str, str, bool]:
+    """Find or create the Report folder named target_folder_name; returns (Id, DeveloperName, created)."""
     sf = get_salesforce_client()
     logger.info("Ensuring Report folder exists: Name='%s'", target_folder_name)
     # Try to find by Name; if not exist, create Folder record
-    soql = (
-        "SELECT Id, Name, DeveloperName FROM Folder WHERE Type = 'Report' "
-        f"AND Name = '{target_folder_name}'"
-    )
-    res = sf.sobjects.query(soql)
-    if res:
-        dev = res[0]["DeveloperName"]
-        logger.info("Found existing Report folder: DeveloperName='%s'", dev)
-        return dev
+    by_name, existing_devnames = _get_folder_index("Report")
+    found = by_name.get(target_folder_name.casefold())
+    if found:
+        logger.info("Found existing Report folder: DeveloperName='%s'", found[1])
+        return found[0], found[1], False
 
     # Deduplicate DeveloperName across all report folders in org
-    existing_devnames_res = sf.sobjects.query(
-        "SELECT DeveloperName FROM Folder WHERE Type = 'Report'"
-    )
-    existing_devnames: Set[str] = (
-        {r["DeveloperName"] for r in existing_devnames_res} if existing_devnames_res else set()
-    )
     base = _to_devname(target_folder_name)
-    unique_devname = _dedupe_developer_name(base, existing_devnames)
+    unique_devname = _dedupe_developer_name(base, set(existing_devnames))
 
     create_body = {
         "Name": target_folder_name,
@@ -165,31 +349,29 @@ def _ensure_report_folder_exists(target_folder_name: str) -> str:
         target_folder_name,
         unique_devname,
     )
-    sf.sobjects.Folder.insert(create_body)
-    return unique_devname
-
-
-def _ensure_dashboard_folder_exists(target_folder_name: str) -> str:
+    created = sf.sobjects.Folder.insert(create_body)
+    existing_devnames.add(unique_devname)
+    invalidate_folder_lists()
+    invalidate_folder_cache()
+    folder_id = created.get("id") if isinstance(created, dict) else None
+    if not folder_id:
+        folder_id = _get_folder_id_by_devname("Report", unique_devname)
+    by_name[target_folder_name.casefold()] = (folder_id, unique_devname)
+    return folder_id, unique_devname, True
+
+
+def _ensure_dashboard_folder_exists(target_folder_name: str) -> Tuple[str, str, bool]:
+    """Find or create the Dashboard folder named target_folder_name; returns (Id, DeveloperName, created)."""
     sf = get_salesforce_client()
     logger.info("Ensuring Dashboard folder exists: Name='%s'", target_folder_name)
-    soql = (
-        "SELECT Id, Name, DeveloperName FROM Folder WHERE Type = 'Dashboard' "
-        f"AND Name = '{target_folder_name}'"
-    )
-    res = sf.sobjects.query(soql)
-    if res:
-        dev = res[0]["DeveloperName"]
-        logger.info("Found existing Dashboard folder: DeveloperName='%s'", dev)
-        return dev
+    by_name, existing_devnames = _get_folder_index("Dashboard")
+    found = by_name.get(target_folder_name.casefold())
+    if found:
+        logger.info("Found existing Dashboard folder: DeveloperName='%s'", found[1])
+        return found[0], found[1], False
 
-    existing_devnames_res = sf.sobjects.query(
-        "SELECT DeveloperName FROM Folder WHERE Type = 'Dashboard'"
-    )
-    existing_devnames: Set[str] = (
-        {r["DeveloperName"] for r in existing_devnames_res} if existing_devnames_res else set()
-    )
     base = _to_devname(target_folder_name)
-    unique_devname = _dedupe_developer_name(base, existing_devnames)
+    unique_devname = _dedupe_developer_name(base, set(existing_devnames))
 
     create_body = {
         "Name": target_folder_name,
@@ -202,8 +384,38 @@ def _ensure_dashboard_folder_exists(target_folder_name: str) -> str:
         target_folder_name,
         unique_devname,
     )
-    sf.sobjects.Folder.insert(create_body)
-    return unique_devname
+    created = sf.sobjects.Folder.insert(create_body)
+    existing_devnames.add(unique_devname)
+    invalidate_folder_lists()
+    invalidate_folder_cache()
+    folder_id = created.get("id") if isinstance(created, dict) else None
+    if not folder_id:
+        folder_id = _get_folder_id_by_devname("Dashboard", unique_devname)
+    by_name[target_folder_name.casefold()] = (folder_id, unique_devname)
+    return folder_id, unique_devname, True
+
+
+def _get_folder_index(folder_type: str) -> Tuple[Dict[str, Tuple[str, str]], Set[str]]:
+    """Folders of folder_type keyed by case-folded Name -> (Id, DeveloperName), plus every
+    DeveloperName in the org, from one SOQL cached briefly.
+
+    The returned structures are the cached ones; callers record folders they create in them.
+    """
+    now = time.monotonic()
+    hit = _FOLDER_INDEX_CACHE.get(folder_type)
+    if hit is not None and hit[0] > now:
+        return hit[1], hit[2]
+    sf = get_salesforce_client()
+    res = sf.sobjects.query(f"SELECT Id, Name, DeveloperName FROM Folder WHERE Type = '{folder_type}'")
+    by_name: Dict[str, Tuple[str, str]] = {}
+    devnames: Set[str] = set()
+    for r in res or []:
+        devnames.add(r["DeveloperName"])
+        # SOQL compares Name case-insensitively; keep the first match like res[0] did
+        if r.get("Name"):
+            by_name.setdefault(r["Name"].casefold(), (r["Id"], r["DeveloperName"]))
+    _FOLDER_INDEX_CACHE[folder_type] = (now + _FOLDER_INDEX_TTL_SECONDS, by_name, devnames)
+    return by_name, devnames
 
 
 def _get_folder_id_by_devname(folder_type: str, folder_devname: str) -> str:
@@ -212,7 +424,7 @@ def _get_folder_id_by_devname(folder_type: str, folder_devname: str) -> str:
         "SELECT Id FROM Folder WHERE Type = '"
         + folder_type
         + "' AND DeveloperName = '"
-        + folder_devname
+        + _soql_str(folder_devname)
         + "'"
     )
     res = sf.sobjects.query(soql)
@@ -221,6 +433,28 @@ def _get_folder_id_by_devname(folder_type: str, folder_devname: str) -> str:
     return res[0]["Id"]
 
 
+def _report_fullnames(folder_devname: str, devnames) -> List[str]:
+    """Folder/DeveloperName fullnames for devnames, skipping blanks and duplicates, in order."""
+    seen: Set[str] = set()
+    fullnames: List[str] = []
+    for dev in devnames:
+        if dev and (fullname := f"{folder_devname}/{dev}") not in seen:
+            seen.add(fullname)
+            fullnames.append(fullname)
+    return fullnames
+
+
+_item_devname = itemgetter("developerName")
+
+
+def _target_folder_devnames(folder_id: str, item_type: str, created: bool) -> Set[str]:
+    """DeveloperNames already in the target folder, for dedupe; a folder we just created is empty."""
+    if created:
+        return set()
+    # _list_folder_items always sets developerName (possibly ""), so no .get() fallback is needed
+    return {dev for dev in map(_item_devname, _list_folder_items(folder_id, item_type)) if dev}
+
+
 def _list_reports_in_folder_via_soql(folder_name: str) -> List[Dict[str, str]]:
     """List reports by Folder Name using SOQL to avoid Analytics 'recent' pollution.
 
@@ -228,7 +462,7 @@ def _list_reports_in_folder_via_soql(folder_name: str) -> List[Dict[str, str]]:
     """
     sf = get_salesforce_client()
     # Query Report by FolderName to avoid relationship/field differences across API versions
-    safe_name = folder_name.replace("'", "\\'")
+    safe_name = _soql_str(folder_name)
     soql = (
         "SELECT Id, Name, DeveloperName FROM Report WHERE FolderName = '"
         + safe_name
@@ -238,37 +472,45 @@ def _list_reports_in_folder_via_soql(folder_name: str) -> List[Dict[str, str]]:
     return rows
 
 
-def _dedupe_developer_name(base: str, existing: Set[str]) -> str:
-    if base not in existing:
-        existing.add(base)
-        return base
-    suffix = "_copy"
-    n = 2
-    candidate = base + suffix
+def _copy_candidate(base: str, n: int) -> str:
+    # Suffix sequence shared by both helpers: _copy, _copy_2, _copy_3, ...
+    return f"{base}_copy" if n == 1 else f"{base}_copy_{n}"
+
+
+def _next_free_copy_name(base: str, existing: Set[str], counters: Dict[str, int] | None) -> str:
+    n = counters.get(base, 1) if counters is not None else 1
+    candidate = _copy_candidate(base, n)
     while candidate in existing:
-        candidate = f"{base}{suffix}_{n}"
         n += 1
+        candidate = _copy_candidate(base, n)
+    if counters is not None:
+        # Names are only ever added to existing, so earlier suffixes stay taken
+        counters[base] = n + 1
     existing.add(candidate)
     return candidate
 
 
-def _force_new_developer_name(base: str, existing: Set[str]) -> str:
-    """Always return a different name than base, updating existing set."""
-    suffix = "_copy"
-    n = 1
-    candidate = f"{base}{suffix}"
-    while candidate in existing or candidate == base:
-        n += 1
-        candidate = f"{base}{suffix}_{n}"
-    existing.add(candidate)
-    return candidate
+def _dedupe_developer_name(base: str, existing: Set[str], counters: Dict[str, int] | None = None) -> str:
+    if base not in existing:
+        existing.add(base)
+        return base
+    return _next_free_copy_name(base, existing, counters)
+
+
+def _force_new_developer_name(base: str, existing: Set[str], counters: Dict[str, int] | None = None) -> str:
+    """Always return a different name than base, updating existing set.
+
+    Pass the same counters dict for every call against one existing set to resume
+    from the last used suffix instead of re-probing from _copy.
+    """
+    return _next_free_copy_name(base, existing, counters)
 
 
 def copy_report_folder(source_folder_id: str, target_folder_name: str) -> None:
     sf = get_salesforce_client()
 
     src_folder_devname, src_folder_name = _get_folder_devname_by_id(source_folder_id)
-    tgt_folder_devname = _ensure_report_folder_exists(target_folder_name)
+    tgt_folder_id, tgt_folder_devname, tgt_created = _ensure_report_folder_exists(target_folder_name)
 
     # Determine reports within the source folder via Analytics REST, then retrieve exactly those
     logger.info(
@@ -287,31 +529,21 @@ def copy_report_folder(source_folder_id: str, target_folder_name: str) -> None:
         )
         return
     # Build fullnames from DeveloperName
-    fullnames = [f"{src_folder_devname}/" + it.get("DeveloperName", "") for it in items if it.get("DeveloperName")]
-    # Deduplicate while preserving order
-    fullnames = list(dict.fromkeys(fullnames))
+    fullnames = _report_fullnames(src_folder_devname, (it.get("DeveloperName") for it in items))
     logger.info("Reports to retrieve (%d): %s", len(fullnames), ", ".join(fullnames) if fullnames else "<none>")
-    retrieve_types = [SfType("Report", fullnames)]
+    retrieve_types = [_sf_type("Report", fullnames)]
     retr = sf.retrieve.retrieve(retrieve_types)
     logger.info("Waiting for reports retrieve job...")
-    retr.wait()
+    _wait_for_retrieve(retr)
     source_zip = retr.get_zip_file()  # BytesIO
-    try:
-        raw_zip = source_zip.getvalue()
-        with zipfile.ZipFile(BytesIO(raw_zip), "r") as zsrc:
-            logger.info("Retrieved zip entries: %s", ", ".join(zsrc.namelist()))
-    except Exception as exc:
-        logger.debug("Could not inspect retrieved zip: %s", exc)
-        raw_zip = source_zip.getvalue()
+    source_zip.seek(0)
 
     # Build new zip with files moved to target folder (dedupe collisions) and package.xml regenerated
-    tgt_folder_id = _get_folder_id_by_devname("Report", tgt_folder_devname)
-    existing_items = _list_folder_items(tgt_folder_id, "Report")
-    existing: Set[str] = {row.get("developerName", "") for row in existing_items if row.get("developerName")}
-    new_zip_bytes = _repack_reports_zip(
-        BytesIO(raw_zip), src_folder_devname, tgt_folder_devname, existing, force_rename=True
+    existing = _target_folder_devnames(tgt_folder_id, "Report", tgt_created)
+    repacked = _repack_reports_zip(
+        source_zip, src_folder_devname, tgt_folder_devname, existing, force_rename=True
     )
-    _deploy_zip(new_zip_bytes)
+    _deploy_zip(repacked.zip_bytes)
 
 
 def prepare_report_copy(source_folder_id: str, target_folder_name: str) -> Dict[str, object]:
@@ -322,7 +554,7 @@ def prepare_report_copy(source_folder_id: str, target_folder_name: str) -> Dict[
     sf = get_salesforce_client()
 
     src_folder_devname, src_folder_name = _get_folder_devname_by_id(source_folder_id)
-    tgt_folder_devname = _ensure_report_folder_exists(target_folder_name)
+    tgt_folder_id, tgt_folder_devname, tgt_created = _ensure_report_folder_exists(target_folder_name)
 
     logger.info(
         "Preparing package for Report folder copy: source_devname='%s' -> target_name='%s' (target_devname='%s')",
@@ -334,43 +566,25 @@ def prepare_report_copy(source_folder_id: str, target_folder_name: str) -> Dict[
     logger.info("Listed reports via SOQL in folder '%s': %d", src_folder_name, len(items))
     if not items:
         return {"members": [], "package_xml": "", "zip_path": "", "target_folder_devname": tgt_folder_devname}
-    fullnames = [f"{src_folder_devname}/" + it.get("DeveloperName", "") for it in items if it.get("DeveloperName")]
-    fullnames = list(dict.fromkeys(fullnames))
-    retrieve_types = [SfType("Report", fullnames)]
+    fullnames = _report_fullnames(src_folder_devname, (it.get("DeveloperName") for it in items))
+    retrieve_types = [_sf_type("Report", fullnames)]
     retr = sf.retrieve.retrieve(retrieve_types)
     logger.info("Waiting for reports retrieve job (prepare)...")
-    retr.wait()
+    _wait_for_retrieve(retr)
     source_zip = retr.get_zip_file()
-    raw_zip = source_zip.getvalue()
-
-    tgt_folder_id = _get_folder_id_by_devname("Report", tgt_folder_devname)
-    existing_items = _list_folder_items(tgt_folder_id, "Report")
-    existing: Set[str] = {row.get("developerName", "") for row in existing_items if row.get("developerName")}
-    new_zip_bytes = _repack_reports_zip(BytesIO(raw_zip), src_folder_devname, tgt_folder_devname, existing, force_rename=True)
-
-    # Inspect prepared zip: members and package.xml
-    members: List[str] = []
-    package_xml = ""
-    with zipfile.ZipFile(new_zip_bytes, "r") as zf:
-        for n in zf.namelist():
-            if n.startswith(f"reports/{tgt_folder_devname}/") and n.endswith(".report"):
-                dev = n.split("/")[-1].removesuffix(".report")
-                members.append(f"{tgt_folder_devname}/{dev}")
-        try:
-            package_xml = zf.read("package.xml").decode("utf-8", errors="replace")
-        except Exception:
-            package_xml = ""
-
-    # Persist zip to temp file
-    new_zip_bytes.seek(0)
-    with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp:
-        tmp.write(new_zip_bytes.read())
-        tmp.flush()
+    source_zip.seek(0)
+
+    existing = _target_folder_devnames(tgt_folder_id, "Report", tgt_created)
+    # Repack straight into the artifact file rather than via an in-memory copy
+    with _new_artifact() as tmp:
+        repacked = _repack_reports_zip(
+            source_zip, src_folder_devname, tgt_folder_devname, existing, force_rename=True, dest=tmp
+        )
         zip_path = tmp.name
-    logger.info("Prepared zip stored at %s with %d member(s)", zip_path, len(members))
+    logger.info("Prepared zip stored at %s with %d member(s)", zip_path, len(repacked.members))
     return {
-        "members": members,
-        "package_xml": package_xml,
+        "members": repacked.members,
+        "package_xml": repacked.package_xml,
         "zip_path": zip_path,
         "target_folder_devname": tgt_folder_devname,
     }
@@ -388,57 +602,37 @@ def prepare_selected_reports_copy(
     sf = get_salesforce_client()
 
     src_folder_devname, _ = _get_folder_devname_by_id(source_folder_id)
-    tgt_folder_devname = _ensure_report_folder_exists(target_folder_name)
+    tgt_folder_id, tgt_folder_devname, tgt_created = _ensure_report_folder_exists(target_folder_name)
 
     if not selected_report_ids:
         return {"members": [], "package_xml": "", "zip_path": "", "target_folder_devname": tgt_folder_devname}
 
     # Resolve Id -> DeveloperName for selected reports
     id_to_dev = _resolve_report_developernames(selected_report_ids)
-    fullnames = [f"{src_folder_devname}/{dev}" for dev in id_to_dev.values() if dev]
-    # Deduplicate while preserving order
-    fullnames = list(dict.fromkeys(fullnames))
+    fullnames = _report_fullnames(src_folder_devname, id_to_dev.values())
     if not fullnames:
         return {"members": [], "package_xml": "", "zip_path": "", "target_folder_devname": tgt_folder_devname}
 
     # Retrieve just the selected reports
-    retr = sf.retrieve.retrieve([SfType("Report", fullnames)])
-    retr.wait()
+    retr = sf.retrieve.retrieve([_sf_type("Report", fullnames)])
+    _wait_for_retrieve(retr)
     source_zip = retr.get_zip_file()
-    raw_zip = source_zip.getvalue()
+    source_zip.seek(0)
 
     # Prepare existing names in the target folder to dedupe
-    tgt_folder_id = _get_folder_id_by_devname("Report", tgt_folder_devname)
-    existing_items = _list_folder_items(tgt_folder_id, "Report")
-    existing: Set[str] = {row.get("developerName", "") for row in existing_items if row.get("developerName")}
-
-    # Build new zip with files moved to target folder
-    new_zip_bytes = _repack_reports_zip(BytesIO(raw_zip), src_folder_devname, tgt_folder_devname, existing, force_rename=True)
-
-    # Inspect prepared zip: members and package.xml
-    members: List[str] = []
-    package_xml = ""
-    with zipfile.ZipFile(new_zip_bytes, "r") as zf:
-        for n in zf.namelist():
-            if n.startswith(f"reports/{tgt_folder_devname}/") and n.endswith(".report"):
-                dev = n.split("/")[-1].removesuffix(".report")
-                members.append(f"{tgt_folder_devname}/{dev}")
-        try:
-            package_xml = zf.read("package.xml").decode("utf-8", errors="replace")
-        except Exception:
-            package_xml = ""
-
-    # Persist zip to temp file
-    new_zip_bytes.seek(0)
-    with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp:
-        tmp.write(new_zip_bytes.read())
-        tmp.flush()
+    existing = _target_folder_devnames(tgt_folder_id, "Report", tgt_created)
+
+    # Build new zip with files moved to target folder, written straight to the artifact file
+    with _new_artifact() as tmp:
+        repacked = _repack_reports_zip(
+            source_zip, src_folder_devname, tgt_folder_devname, existing, force_rename=True, dest=tmp
+        )
         zip_path = tmp.name
 
-    logger.info("Prepared selective reports zip stored at %s with %d member(s)", zip_path, len(members))
+    logger.info("Prepared selective reports zip stored at %s with %d member(s)", zip_path, len(repacked.members))
     return {
-        "members": members,
-        "package_xml": package_xml,
+        "members": repacked.members,
+        "package_xml": repacked.package_xml,
         "zip_path": zip_path,
         "target_folder_devname": tgt_folder_devname,
     }
@@ -449,96 +643,166 @@ def _resolve_report_developernames(report_ids: List[str]) -> Dict[str, str]:
 
     Uses chunking to respect SOQL limits. Returns mapping of Id to DeveloperName.
     """
-    sf = get_salesforce_client()
-    mapping: Dict[str, str] = {}
     if not report_ids:
-        return mapping
-    chunk_size = 200
-    for i in range(0, len(report_ids), chunk_size):
-        chunk = [rid for rid in report_ids[i:i + chunk_size] if rid]
-        if not chunk:
+        return {}
+    now = time.monotonic()
+    resolved: Dict[str, str] = {}
+    misses: List[str] = []
+    for rid in report_ids:
+        if not rid:
             continue
-        ids_clause = ",".join(f"'{rid}'" for rid in chunk)
-        soql = f"SELECT Id, DeveloperName FROM Report WHERE Id IN ({ids_clause})"
-        try:
-            res = sf.sobjects.query(soql)
-            for row in res or []:
-                rid = row.get("Id")
-                dev = row.get("DeveloperName")
-                if rid and dev:
-                    mapping[rid] = dev
-        except Exception as exc:
-            logger.warning(
-                "Failed to resolve DeveloperName for %d report ids: %s",
-                len(chunk), exc,
-            )
+        hit = _REPORT_DEVNAME_CACHE.get(rid)
+        if hit is not None and hit[0] > now:
+            resolved[rid] = hit[1]
+        else:
+            misses.append(rid)
+    # The query goes out as a GET ?q= parameter, so the binding limit is Salesforce's 16,384-byte
+    # URI, not SOQL length: an encoded 18-char Id costs ~27 bytes, so 400 Ids keep it near 11 KB
+    chunk_size = 400
+    chunks = [misses[i:i + chunk_size] for i in range(0, len(misses), chunk_size)]
+    if len(chunks) > 1:
+        # Chunks are independent queries
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(_query_report_developernames, chunks))
+    else:
+        results = [_query_report_developernames(chunk) for chunk in chunks]
+    expires = now + _REPORT_DEVNAME_TTL_SECONDS
+    for part in results:
+        for rid, dev in part.items():
+            _REPORT_DEVNAME_CACHE[rid] = (expires, dev)
+        resolved.update(part)
+    # Keep the caller's Id order whether a name came from the cache or a query
+    mapping = {rid: resolved[rid] for rid in report_ids if rid in resolved}
+    if misses:
+        logger.info("Queried DeveloperName for %d uncached report ids", len(misses))
     logger.info("Resolved DeveloperName for %d/%d reports", len(mapping), len(report_ids))
     return mapping
 
 
+def _query_report_developernames(chunk: List[str]) -> Dict[str, str]:
+    sf = get_salesforce_client()
+    mapping: Dict[str, str] = {}
+    ids_clause = ",".join(f"'{_soql_str(rid)}'" for rid in chunk)
+    soql = f"SELECT Id, DeveloperName FROM Report WHERE Id IN ({ids_clause})"
+    try:
+        res = sf.sobjects.query(soql)
+    except Exception as exc:
+        # Skipping the chunk would quietly drop those reports from the user's selection
+        logger.error("Failed to resolve DeveloperName for %d report ids: %s", len(chunk), exc)
+        raise RuntimeError(f"Failed to resolve DeveloperName for {len(chunk)} report ids") from exc
+    for row in res or []:
+        rid = row.get("Id")
+        dev = row.get("DeveloperName")
+        if rid and dev:
+            mapping[rid] = dev
+    return mapping
+
+
 def copy_dashboard_with_reports(
     source_dashboard_folder_id: str,
     source_dashboard_developer_name: str,
     target_dashboard_folder_name: str,
     target_report_folder_name: str,
 ) -> None:
-    sf = get_salesforce_client()
-
-    src_folder_devname, _ = _get_folder_devname_by_id(source_dashboard_folder_id)
-    tgt_dash_folder_devname = _ensure_dashboard_folder_exists(target_dashboard_folder_name)
-    # Ensure report folder exists for copied reports
-    tgt_report_folder_devname = _ensure_report_folder_exists(target_report_folder_name)
-
-    dashboard_fullname = f"{src_folder_devname}/{source_dashboard_developer_name}"
-    logger.info(
-        "Starting copy of Dashboard '%s' to target folders (dashboard='%s', reports='%s')",
-        dashboard_fullname,
+    repacked, _, _ = _build_dashboard_deploy_zip(
+        source_dashboard_folder_id,
+        source_dashboard_developer_name,
         target_dashboard_folder_name,
         target_report_folder_name,
     )
+    _deploy_zip(repacked.zip_bytes)
 
-    # Retrieve dashboard first
-    retr = sf.retrieve.retrieve([SfType("Dashboard", [dashboard_fullname])])
-    logger.info("Waiting for dashboard retrieve job...")
-    retr.wait()
-    dash_zip = retr.get_zip_file()
-
-    # Extract dashboard XML and find referenced reports
-    dash_xml_path = f"dashboards/{src_folder_devname}/{source_dashboard_developer_name}.dashboard"
-    with zipfile.ZipFile(dash_zip, "r") as zf:
-        xml_bytes = zf.read(dash_xml_path)
-    referenced_reports = _extract_report_fullnames_from_dashboard_xml(
-        xml_bytes.decode("utf-8")
-    )
-    logger.info(
-        "Referenced reports in dashboard (%d): %s",
-        len(referenced_reports),
-        ", ".join(referenced_reports) if referenced_reports else "<none>",
-    )
 
-    # Retrieve all referenced reports
-    if referenced_reports:
-        retr2 = sf.retrieve.retrieve([SfType("Report", referenced_reports)])
-        logger.info("Waiting for referenced reports retrieve job...")
-        retr2.wait()
-        reports_zip = retr2.get_zip_file()
-    else:
-        reports_zip = BytesIO()
-        with zipfile.ZipFile(reports_zip, "w"):
-            pass
-        reports_zip.seek(0)
+def _cached_dashboard_refs(dashboard_fullname: str) -> List[str]:
+    hit = _DASHBOARD_REFS_CACHE.get(dashboard_fullname)
+    if hit is not None and hit[0] > time.monotonic():
+        return hit[1]
+    return []
+
+
+def _build_dashboard_deploy_zip(
+    source_dashboard_folder_id: str,
+    source_dashboard_developer_name: str,
+    target_dashboard_folder_name: str,
+    target_report_folder_name: str,
+    dest: BinaryIO | None = None,
+) -> Tuple[RepackResult, str, str]:
+    """Retrieve a dashboard and the reports it references, repacked for the target folders.
+
+    The package is written to dest (a new BytesIO if not given). Returns
+    (repacked package, target dashboard folder DeveloperName, target report folder DeveloperName).
+    """
+    sf = get_salesforce_client()
+
+    def retrieve_dashboard() -> Tuple[str, BytesIO, List[str], BytesIO | None]:
+        src_folder_devname, _ = _get_folder_devname_by_id(source_dashboard_folder_id)
+        dashboard_fullname = f"{src_folder_devname}/{source_dashboard_developer_name}"
+        logger.info(
+            "Building package for Dashboard '%s' to target folders (dashboard='%s', reports='%s')",
+            dashboard_fullname,
+            target_dashboard_folder_name,
+            target_report_folder_name,
+        )
+        # Reports can only be named once the dashboard XML is read; if this dashboard was
+        # built recently (prepare, then copy), fetch its last known reports in the same job
+        predicted = _cached_dashboard_refs(dashboard_fullname)
+        retrieve_types = [_sf_type("Dashboard", [dashboard_fullname])]
+        if predicted:
+            retrieve_types.append(_sf_type("Report", predicted))
+        retr = sf.retrieve.retrieve(retrieve_types)
+        logger.info("Waiting for dashboard retrieve job...")
+        _wait_for_retrieve(retr)
+        dash_zip = retr.get_zip_file()
+
+        # Extract dashboard XML and find referenced reports
+        dash_xml_path = f"dashboards/{src_folder_devname}/{source_dashboard_developer_name}.dashboard"
+        with zipfile.ZipFile(dash_zip, "r") as zf, zf.open(dash_xml_path) as fp:
+            refs = _extract_report_fullnames_stream(fp)
+        _DASHBOARD_REFS_CACHE[dashboard_fullname] = (time.monotonic() + _DASHBOARD_REFS_TTL_SECONDS, refs)
+        # The combined zip is only usable if it holds exactly the reports the dashboard uses
+        reports_zip = dash_zip if predicted and refs == predicted else None
+        return src_folder_devname, dash_zip, refs, reports_zip
+
+    def prepare_target(ensure, folder_name: str, item_type: str) -> Tuple[str, Set[str]]:
+        folder_id, devname, created = ensure(folder_name)
+        return devname, _target_folder_devnames(folder_id, item_type, created)
+
+    # Target folder setup doesn't depend on the dashboard, so it overlaps the retrieve and its polling
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        dash_job = pool.submit(retrieve_dashboard)
+        dash_target_job = pool.submit(
+            prepare_target, _ensure_dashboard_folder_exists, target_dashboard_folder_name, "Dashboard"
+        )
+        report_target_job = pool.submit(
+            prepare_target, _ensure_report_folder_exists, target_report_folder_name, "Report"
+        )
+
+        src_folder_devname, dash_zip, referenced_reports, reports_zip = dash_job.result()
+        logger.info(
+            "Referenced reports in dashboard (%d): %s",
+            len(referenced_reports),
+            ", ".join(referenced_reports) if referenced_reports else "<none>",
+        )
 
-    # Prepare existing names in target folders for dedupe
-    tgt_report_folder_id = _get_folder_id_by_devname("Report", tgt_report_folder_devname)
-    existing_reports_items = _list_folder_items(tgt_report_folder_id, "Report")
-    report_existing: Set[str] = {r.get("developerName", "") for r in existing_reports_items if r.get("developerName")}
+        # Retrieve all referenced reports, unless they came with the dashboard
+        if reports_zip is not None:
+            logger.info("Referenced reports were retrieved with the dashboard")
+        elif referenced_reports:
+            retr2 = sf.retrieve.retrieve([_sf_type("Report", referenced_reports)])
+            logger.info("Waiting for referenced reports retrieve job...")
+            _wait_for_retrieve(retr2)
+            reports_zip = retr2.get_zip_file()
+        else:
+            reports_zip = BytesIO()
+            with zipfile.ZipFile(reports_zip, "w"):
+                pass
+            reports_zip.seek(0)
 
-    tgt_dash_folder_id = _get_folder_id_by_devname("Dashboard", tgt_dash_folder_devname)
-    existing_dash_items = _list_folder_items(tgt_dash_folder_id, "Dashboard")
-    dashboard_existing: Set[str] = {d.get("developerName", "") for d in existing_dash_items if d.get("developerName")}
+        tgt_dash_folder_devname, dashboard_existing = dash_target_job.result()
+        tgt_report_folder_devname, report_existing = report_target_job.result()
 
     # Build deployable zip: moved reports and rewritten dashboard
-    deploy_zip = _repack_dashboard_and_reports_zip(
+    repacked = _repack_dashboard_and_reports_zip(
         dash_zip,
         reports_zip,
         src_folder_devname,
@@ -547,8 +811,9 @@ def copy_dashboard_with_reports(
         source_dashboard_developer_name,
         report_existing,
         dashboard_existing,
+        dest=dest,
     )
-    _deploy_zip(deploy_zip)
+    return repacked, tgt_dash_folder_devname, tgt_report_folder_devname
 
 
 def prepare_dashboard_copy(
@@ -561,209 +826,229 @@ def prepare_dashboard_copy(
 
     Returns dictionary with: members_reports (List[str]), member_dashboard (str), package_xml (str), zip_path (str), target_folder_devname (str)
     """
-    sf = get_salesforce_client()
-
-    src_folder_devname, _ = _get_folder_devname_by_id(source_dashboard_folder_id)
-    tgt_dash_folder_devname = _ensure_dashboard_folder_exists(target_dashboard_folder_name)
-    tgt_report_folder_devname = _ensure_report_folder_exists(target_report_folder_name)
-
-    dashboard_fullname = f"{src_folder_devname}/{source_dashboard_developer_name}"
-    logger.info(
-        "Preparing package for Dashboard '%s' to target folders (dashboard='%s', reports='%s')",
-        dashboard_fullname,
-        target_dashboard_folder_name,
-        target_report_folder_name,
-    )
-    retr = sf.retrieve.retrieve([SfType("Dashboard", [dashboard_fullname])])
-    retr.wait()
-    dash_zip = retr.get_zip_file()
-
-    dash_xml_path = f"dashboards/{src_folder_devname}/{source_dashboard_developer_name}.dashboard"
-    with zipfile.ZipFile(dash_zip, "r") as zf:
-        xml_bytes = zf.read(dash_xml_path)
-    referenced_reports = _extract_report_fullnames_from_dashboard_xml(xml_bytes.decode("utf-8"))
-
-    if referenced_reports:
-        retr2 = sf.retrieve.retrieve([SfType("Report", referenced_reports)])
-        retr2.wait()
-        reports_zip = retr2.get_zip_file()
-    else:
-        reports_zip = BytesIO()
-        with zipfile.ZipFile(reports_zip, "w"):
-            pass
-        reports_zip.seek(0)
-
-    tgt_report_folder_id = _get_folder_id_by_devname("Report", tgt_report_folder_devname)
-    existing_reports_items = _list_folder_items(tgt_report_folder_id, "Report")
-    report_existing: Set[str] = {r.get("developerName", "") for r in existing_reports_items if r.get("developerName")}
-
-    tgt_dash_folder_id = _get_folder_id_by_devname("Dashboard", tgt_dash_folder_devname)
-    existing_dash_items = _list_folder_items(tgt_dash_folder_id, "Dashboard")
-    dashboard_existing: Set[str] = {d.get("developerName", "") for d in existing_dash_items if d.get("developerName")}
-
-    deploy_zip = _repack_dashboard_and_reports_zip(
-        dash_zip,
-        reports_zip,
-        src_folder_devname,
-        tgt_dash_folder_devname,
-        tgt_report_folder_devname,
-        source_dashboard_developer_name,
-        report_existing,
-        dashboard_existing,
-    )
-
-    members_reports: List[str] = []
-    member_dashboard: str = ""
-    package_xml = ""
-    with zipfile.ZipFile(deploy_zip, "r") as zf:
-        for n in zf.namelist():
-            if n.startswith(f"reports/{tgt_report_folder_devname}/") and n.endswith(".report"):
-                dev = n.split("/")[-1].removesuffix(".report")
-                members_reports.append(f"{tgt_report_folder_devname}/{dev}")
-            if n.startswith(f"dashboards/{tgt_dash_folder_devname}/") and n.endswith(".dashboard"):
-                dev = n.split("/")[-1].removesuffix(".dashboard")
-                member_dashboard = f"{tgt_dash_folder_devname}/{dev}"
-        try:
-            package_xml = zf.read("package.xml").decode("utf-8", errors="replace")
-        except Exception:
-            package_xml = ""
-
-    deploy_zip.seek(0)
-    with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp:
-        tmp.write(deploy_zip.read())
-        tmp.flush()
+    with _new_artifact() as tmp:
+        repacked, tgt_dash_folder_devname, tgt_report_folder_devname = _build_dashboard_deploy_zip(
+            source_dashboard_folder_id,
+            source_dashboard_developer_name,
+            target_dashboard_folder_name,
+            target_report_folder_name,
+            dest=tmp,
+        )
         zip_path = tmp.name
     logger.info(
         "Prepared dashboard zip stored at %s with %d report(s) and dashboard '%s'",
         zip_path,
-        len(members_reports),
-        member_dashboard,
+        len(repacked.members),
+        repacked.dashboard,
     )
     return {
-        "members_reports": members_reports,
-        "member_dashboard": member_dashboard,
-        "package_xml": package_xml,
+        "members_reports": repacked.members,
+        "member_dashboard": repacked.dashboard,
+        "package_xml": repacked.package_xml,
         "zip_path": zip_path,
         "target_dashboard_devname": tgt_dash_folder_devname,
         "target_report_devname": tgt_report_folder_devname,
     }
 
 
+@contextmanager
+def _new_artifact():
+    """Open a new prepared-package file in the temp dir; it is removed again if building it fails."""
+    tmp = tempfile.NamedTemporaryFile(prefix=_ARTIFACT_PREFIX, suffix=".zip", delete=False)
+    try:
+        with tmp:
+            yield tmp
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
+def get_artifact_path(name: str) -> str | None:
+    """Resolve a prepared package file name to its path, or None if it is not one of ours."""
+    if os.path.basename(name) != name or not name.startswith(_ARTIFACT_PREFIX) or not name.endswith(".zip"):
+        return None
+    path = os.path.join(tempfile.gettempdir(), name)
+    return path if os.path.isfile(path) else None
+
+
 def start_deploy(zip_path: str) -> str:
+    """Queue a deployment of zip_path and return its job id immediately."""
+    job_id = str(uuid.uuid4())
+    logger.info("Queueing deployment job %s for zip %s", job_id, zip_path)
+    _DEPLOY_JOBS[job_id] = _DEPLOY_EXECUTOR.submit(_submit_deploy, job_id, zip_path)
+    return job_id
+
+
+def _submit_deploy(job_id: str, zip_path: str):
     sf = get_salesforce_client()
     from salesforce_api.models.deploy import Options
-    job_id = str(uuid.uuid4())
     logger.info("Starting deployment job %s for zip %s", job_id, zip_path)
-    deployment = sf.deploy.deploy(zip_path, Options(checkOnly=False))
-    _DEPLOY_JOBS[job_id] = deployment
-    return job_id
+    return sf.deploy.deploy(zip_path, Options(checkOnly=False))
 
 
 def get_deploy_status(job_id: str) -> Dict[str, object]:
-    deployment = _DEPLOY_JOBS.get(job_id)
-    if deployment is None:
+    """Deploy job status, shared by all pollers of job_id for a couple of seconds."""
+    now = time.monotonic()
+    hit = _DEPLOY_STATUS_CACHE.get(job_id)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    status = _single_flight(f"deploy:{job_id}", lambda: _fetch_deploy_status(job_id))
+    # Entries are only useful for a couple of seconds; sweep expired ones so finished jobs don't pile up
+    for stale in [k for k, (expires, _) in list(_DEPLOY_STATUS_CACHE.items()) if expires <= now]:
+        _DEPLOY_STATUS_CACHE.pop(stale, None)
+    _DEPLOY_STATUS_CACHE[job_id] = (now + _DEPLOY_STATUS_TTL_SECONDS, status)
+    return status
+
+
+_DEPLOY_STATUS_FIELDS = ("id", "status", "done", "success")
+# (status attribute, output keys for total/completed/failed/percent/failures, fields kept per failure)
+_DEPLOY_DETAILS_SPEC = (
+    (
+        "components",
+        ("numberComponentsTotal", "numberComponentsDeployed", "numberComponentErrors",
+         "componentsProgressPercent", "componentFailures"),
+        ("component_type", "file", "status", "message"),
+    ),
+    (
+        "tests",
+        ("numberTestsTotal", "numberTestsCompleted", "numberTestErrors",
+         "testsProgressPercent", "testFailures"),
+        ("class_name", "method", "message", "stack_trace"),
+    ),
+)
+
+
+def _fetch_deploy_status(job_id: str) -> Dict[str, object]:
+    job = _DEPLOY_JOBS.get(job_id)
+    if job is None:
         return {"error": "job_not_found", "job_id": job_id}
+    if not job.done():
+        return {"job_id": job_id, "status": "Queued", "done": False}
+    exc = job.exception()
+    if exc is not None:
+        logger.warning("Deployment job %s could not be submitted: %s", job_id, exc)
+        return {"job_id": job_id, "status": "Failed", "done": True, "success": False, "details": str(exc)}
+    deployment = job.result()
     status = deployment.get_status()
-    # Serialize common fields if present
     out: Dict[str, object] = {"job_id": job_id}
-    for key in ["id", "status", "done", "success"]:
-        try:
-            out[key] = getattr(status, key)
-        except Exception:
-            pass
+    for key in _DEPLOY_STATUS_FIELDS:
+        out[key] = getattr(status, key, None)
 
-    # Components progress (library exposes DeployDetails at status.components)
-    try:
-        comp = getattr(status, "components", None)
-        if comp is not None:
-            total = getattr(comp, "total_count", None)
-            completed = getattr(comp, "completed_count", None)
-            failed = getattr(comp, "failed_count", None)
-            out["numberComponentsTotal"] = total
-            out["numberComponentsDeployed"] = completed
-            out["numberComponentErrors"] = failed
-            out["componentsProgressPercent"] = (completed * 100 // total) if total else 0
-            # Include component failures if any
-            try:
-                failures = getattr(comp, "failures", []) or []
-                out["componentFailures"] = [
-                    {
-                        "component_type": getattr(f, "component_type", None),
-                        "file": getattr(f, "file", None),
-                        "status": getattr(f, "status", None),
-                        "message": getattr(f, "message", None),
-                    }
-                    for f in failures
-                ]
-            except Exception:
-                pass
-    except Exception:
-        pass
-
-    # Tests progress (library exposes DeployDetails at status.tests)
-    try:
-        tests = getattr(status, "tests", None)
-        if tests is not None:
-            t_total = getattr(tests, "total_count", None)
-            t_completed = getattr(tests, "completed_count", None)
-            t_failed = getattr(tests, "failed_count", None)
-            out["numberTestsTotal"] = t_total
-            out["numberTestsCompleted"] = t_completed
-            out["numberTestErrors"] = t_failed
-            out["testsProgressPercent"] = (t_completed * 100 // t_total) if t_total else 0
-            # Include test failures if any
-            try:
-                t_failures = getattr(tests, "failures", []) or []
-                out["testFailures"] = [
-                    {
-                        "class_name": getattr(f, "class_name", None),
-                        "method": getattr(f, "method", None),
-                        "message": getattr(f, "message", None),
-                        "stack_trace": getattr(f, "stack_trace", None),
-                    }
-                    for f in t_failures
-                ]
-            except Exception:
-                pass
-    except Exception:
-        pass
+    # Components/tests progress (library exposes DeployDetails at status.components/.tests)
+    for attr, keys, failure_fields in _DEPLOY_DETAILS_SPEC:
+        detail = getattr(status, attr, None)
+        if detail is None:
+            continue
+        total_key, completed_key, failed_key, percent_key, failures_key = keys
+        total = getattr(detail, "total_count", None)
+        completed = getattr(detail, "completed_count", None)
+        out[total_key] = total
+        out[completed_key] = completed
+        out[failed_key] = getattr(detail, "failed_count", None)
+        out[percent_key] = ((completed or 0) * 100 // total) if total else 0
+        out[failures_key] = [
+            {field: getattr(f, field, None) for field in failure_fields}
+            for f in getattr(detail, "failures", None) or ()
+        ]
 
     # Failures summary if available
-    try:
-        details = getattr(status, "details", None)
-        if details:
-            out["details"] = str(details)
-    except Exception:
-        pass
+    details = getattr(status, "details", None)
+    if details:
+        out["details"] = str(details)
     return out
 
 
+# Report XML inflates in large reads; one chunk covers most members outright
+_ZIP_COPY_BUFSIZE = 1 << 20
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_ZIP_LOCAL_HEADER_SIGNATURE = b"PK\003\004"
+
+
+def _copy_zip_member(
+    src: zipfile.ZipFile, src_info: zipfile.ZipInfo, out: zipfile.ZipFile, new_name: str
+) -> None:
+    """Copy the src member described by src_info into out as new_name.
+
+    Only the name changes, so the compressed payload is copied as-is; members that
+    can't be copied raw (encrypted, zip64, unusual compression) are streamed through
+    an inflate instead, stored in the output.
+    """
+    raw = _read_raw_zip_member(src, src_info)
+    if raw is None:
+        with src.open(src_info, "r") as fsrc, out.open(new_name, "w") as fdst:
+            shutil.copyfileobj(fsrc, fdst, _ZIP_COPY_BUFSIZE)
+        return
+
+    info = zipfile.ZipInfo(new_name, src_info.date_time)
+    info.compress_type = src_info.compress_type
+    info.external_attr = src_info.external_attr
+    info.CRC = src_info.CRC
+    info.compress_size = src_info.compress_size
+    info.file_size = src_info.file_size
+    # Same bookkeeping as ZipFile.writestr, minus the compressor
+    out.fp.seek(out.start_dir)
+    info.header_offset = out.fp.tell()
+    out._writecheck(info)
+    out._didModify = True
+    out.fp.write(info.FileHeader(False))
+    out.fp.write(raw)
+    out.start_dir = out.fp.tell()
+    out.filelist.append(info)
+    out.NameToInfo[info.filename] = info
+
+
+def _read_raw_zip_member(src: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytes | None:
+    """The still-compressed bytes of a member, or None if it must go through ZipFile.open."""
+    if info.flag_bits & 0x1 or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+        return None
+    if max(info.file_size, info.compress_size, info.header_offset) >= zipfile.ZIP64_LIMIT:
+        return None
+    src.fp.seek(info.header_offset)
+    header = src.fp.read(_ZIP_LOCAL_HEADER.size)
+    if len(header) != _ZIP_LOCAL_HEADER.size:
+        return None
+    fields = _ZIP_LOCAL_HEADER.unpack(header)
+    if fields[0] != _ZIP_LOCAL_HEADER_SIGNATURE:
+        return None
+    # The local header's name/extra lengths can differ from the central directory's
+    src.fp.seek(fields[-2] + fields[-1], os.SEEK_CUR)
+    raw = src.fp.read(info.compress_size)
+    return raw if len(raw) == info.compress_size else None
+
+
 def _repack_reports_zip(
     source_zip: BytesIO,
     src_folder: str,
     tgt_folder: str,
     existing_devnames: Set[str],
     force_rename: bool = False,
-) -> BytesIO:
+    dest: BinaryIO | None = None,
+) -> RepackResult:
+    """Move retrieved reports into tgt_folder under fresh names and write the package to dest.
+
+    dest defaults to a new BytesIO; either way it comes back rewound in RepackResult.zip_bytes.
+    """
     src = zipfile.ZipFile(source_zip, "r")
-    out_bytes = BytesIO()
-    with zipfile.ZipFile(out_bytes, "w", zipfile.ZIP_DEFLATED) as out:
+    logger.info("Retrieved zip entries: %s", ", ".join(src.namelist()))
+    out_bytes = dest if dest is not None else BytesIO()
+    with zipfile.ZipFile(out_bytes, "w", zipfile.ZIP_STORED) as out:
         new_fullnames: List[str] = []
-        for name in src.namelist():
+        suffix_counters: Dict[str, int] = {}
+        for info in src.infolist():
+            name = info.filename
             # Include all reports from the retrieved zip, regardless of original folder
             if not name.startswith("reports/") or not name.endswith(".report"):
                 # skip non-report files from retrieve (e.g., original package.xml)
                 continue
-            content = src.read(name)
             # derive developer name
-            base_devname = name.split("/")[-1].removesuffix(".report")
+            base_devname = os.path.basename(name)[: -len(".report")]
             # If force_rename, ensure a different name so deploy copies instead of moves
             if force_rename:
-                new_devname = _force_new_developer_name(base_devname, existing_devnames)
+                new_devname = _force_new_developer_name(base_devname, existing_devnames, suffix_counters)
             else:
-                new_devname = _dedupe_developer_name(base_devname, existing_devnames)
+                new_devname = _dedupe_developer_name(base_devname, existing_devnames, suffix_counters)
             new_name = f"reports/{tgt_folder}/{new_devname}.report"
-            out.writestr(new_name, content)
+            _copy_zip_member(src, info, out, new_name)
             new_fullnames.append(f"{tgt_folder}/{new_devname}")
 
         # package.xml
@@ -778,7 +1063,7 @@ def _repack_reports_zip(
     logger.info("package.xml contents (Reports):\n%s", pkg)
 
     out_bytes.seek(0)
-    return out_bytes
+    return RepackResult(out_bytes, new_fullnames, pkg)
 
 
 def _repack_dashboard_and_reports_zip(
@@ -790,25 +1075,27 @@ def _repack_dashboard_and_reports_zip(
     dashboard_devname: str,
     report_existing: Set[str],
     dashboard_existing: Set[str],
-) -> BytesIO:
+    dest: BinaryIO | None = None,
+) -> RepackResult:
     dash_src = zipfile.ZipFile(dash_zip, "r")
     rep_src = zipfile.ZipFile(reports_zip, "r")
 
-    out_bytes = BytesIO()
-    with zipfile.ZipFile(out_bytes, "w", zipfile.ZIP_DEFLATED) as out:
+    out_bytes = dest if dest is not None else BytesIO()
+    with zipfile.ZipFile(out_bytes, "w", zipfile.ZIP_STORED) as out:
         report_fullnames: List[str] = []
         rename_map: Dict[str, str] = {}
+        suffix_counters: Dict[str, int] = {}
 
         # write reports moved
-        for name in rep_src.namelist():
+        for info in rep_src.infolist():
+            name = info.filename
             # Include all reports returned in retrieve; they may come from various source folders
             if not name.startswith("reports/") or not name.endswith(".report"):
                 continue
-            content = rep_src.read(name)
-            base_devname = name.split("/")[-1].removesuffix(".report")
-            new_devname = _force_new_developer_name(base_devname, report_existing)
+            base_devname = os.path.basename(name)[: -len(".report")]
+            new_devname = _force_new_developer_name(base_devname, report_existing, suffix_counters)
             new_name = f"reports/{tgt_report_folder}/{new_devname}.report"
-            out.writestr(new_name, content)
+            _copy_zip_member(rep_src, info, out, new_name)
             report_fullnames.append(f"{tgt_report_folder}/{new_devname}")
             # Build rename map for any possible original folder
             try:
@@ -819,12 +1106,11 @@ def _repack_dashboard_and_reports_zip(
 
         # dashboard rewritten
         old_dash_path = f"dashboards/{src_folder}/{dashboard_devname}.dashboard"
-        xml_s = dash_src.read(old_dash_path).decode("utf-8")
-        new_xml_s = _rewrite_dashboard_report_refs(xml_s, rename_map)
+        new_xml = _rewrite_dashboard_report_refs(dash_src.read(old_dash_path), rename_map)
         # Always force rename dashboard to ensure copy-not-move semantics
         new_dash_devname = _force_new_developer_name(dashboard_devname, dashboard_existing)
         new_dash_path = f"dashboards/{tgt_dash_folder}/{new_dash_devname}.dashboard"
-        out.writestr(new_dash_path, new_xml_s.encode("utf-8"))
+        out.writestr(new_dash_path, new_xml)
 
         # package.xml with both types
         pkg = _render_package_xml({
@@ -848,7 +1134,25 @@ def _repack_dashboard_and_reports_zip(
     logger.info("package.xml contents (Dashboard+Reports):\n%s", pkg)
 
     out_bytes.seek(0)
-    return out_bytes
+    return RepackResult(out_bytes, report_fullnames, pkg, dashboard=f"{tgt_dash_folder}/{new_dash_devname}")
+
+
+def _poll_delays(first: float = 0.25, factor: float = 1.5, cap: float = 10.0):
+    """Endless backoff schedule for polling async Metadata API jobs, with +/-20% jitter."""
+    delay = first
+    while True:
+        yield delay * random.uniform(0.8, 1.2)
+        delay = min(delay * factor, cap)
+
+
+def _wait_for_retrieve(retr) -> None:
+    # Retrievement.wait() sleeps a flat 10s between polls; small retrieves finish well before that
+    from salesforce_api.const import STATUSES_DONE
+
+    for delay in _poll_delays():
+        if retr.get_status().status in STATUSES_DONE:
+            return
+        time.sleep(delay)
 
 
 def _deploy_zip(zip_bytes: BytesIO) -> None:
@@ -856,8 +1160,7 @@ def _deploy_zip(zip_bytes: BytesIO) -> None:
     # Inspect and log zip contents and package.xml before deploy
     try:
         zip_bytes.seek(0)
-        raw = zip_bytes.read()
-        with zipfile.ZipFile(BytesIO(raw), "r") as zf:
+        with zipfile.ZipFile(zip_bytes, "r") as zf:
             names = zf.namelist()
             logger.info("Deploying zip with %d entries: %s", len(names), ", ".join(names))
             if "package.xml" in names:
@@ -877,111 +1180,136 @@ def _deploy_zip(zip_bytes: BytesIO) -> None:
                     return
     except Exception as exc:
         logger.warning("Failed to inspect deploy zip: %s", exc)
-        raw = raw if 'raw' in locals() else zip_bytes.getvalue()
-
-    with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp:
-        tmp.write(raw)
-        tmp.flush()
-        from salesforce_api.models.deploy import Options
-
-        logger.info("Starting metadata deployment (checkOnly=False)...")
-        deployment = sf.deploy.deploy(tmp.name, Options(checkOnly=False))
-
-        # Poll for status with logging
-        import time
-        max_wait_seconds = 1800
-        poll_interval = 2
-        waited = 0
-        final_status = None
-        while waited <= max_wait_seconds:
-            status = deployment.get_status()
-            state = getattr(status, "status", None) or getattr(status, "State", None)
-            done = getattr(status, "done", None)
-            success = getattr(status, "success", None)
-            logger.info("Deploy status: status=%s done=%s success=%s", state, done, success)
-            if bool(done) or (isinstance(state, str) and state.lower() in ("succeeded", "failed", "canceled", "completed")):
-                final_status = status
-                break
-            time.sleep(poll_interval)
-            waited += poll_interval
-
-        if final_status is None:
-            # Fallback: ensure we have the latest
-            final_status = deployment.get_status()
-
-        # Summarize final status
-        try:
-            detail_dict = getattr(final_status, "__dict__", {})
-            logger.info("Final deploy status summary: %s", detail_dict)
-        except Exception:
-            logger.info("Final deploy status (raw): %s", str(final_status))
-
-        if getattr(final_status, "success", True) is False:
-            raise RuntimeError("Deployment failed")
+
+    from salesforce_api.models.deploy import Options
+
+    logger.info("Starting metadata deployment (checkOnly=False)...")
+    # deploy() reads file objects directly, so the package never touches disk
+    zip_bytes.seek(0)
+    deployment = sf.deploy.deploy(zip_bytes, Options(checkOnly=False))
+
+    # Poll for status with logging; quick deploys finish on an early poll, long ones back off
+    max_wait_seconds = 1800
+    deadline = time.monotonic() + max_wait_seconds
+    final_status = None
+    for delay in _poll_delays():
+        status = deployment.get_status()
+        state = getattr(status, "status", None) or getattr(status, "State", None)
+        done = getattr(status, "done", None)
+        success = getattr(status, "success", None)
+        logger.info("Deploy status: status=%s done=%s success=%s", state, done, success)
+        if bool(done) or (isinstance(state, str) and state.lower() in ("succeeded", "failed", "canceled", "completed")):
+            final_status = status
+            break
+        if time.monotonic() >= deadline:
+            break
+        time.sleep(delay)
+
+    if final_status is None:
+        # Fallback: ensure we have the latest
+        final_status = deployment.get_status()
+
+    # Summarize final status
+    try:
+        detail_dict = getattr(final_status, "__dict__", {})
+        logger.info("Final deploy status summary: %s", detail_dict)
+    except Exception:
+        logger.info("Final deploy status (raw): %s", str(final_status))
+
+    if getattr(final_status, "success", True) is False:
+        raise RuntimeError("Deployment failed")
+
+
+_PACKAGE_TEMPLATE = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\"?>"
+    "<Package xmlns=\"http://soap.sforce.com/2006/04/metadata\">"
+    "{types}"
+    "<version>{version}</version>"
+    "</Package>"
+)
+_PACKAGE_TYPES_TEMPLATE = "<types>{members}<name>{name}</name></types>"
+# Escapes all XML specials in a single C-level pass per member
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
 
 
 def _render_package_xml(type_to_members: Dict[str, List[str]]) -> str:
     version = os.getenv("SF_API_VERSION") or "58.0"
-    types_xml_parts: List[str] = []
-    for t, members in type_to_members.items():
-        if not members:
-            continue
-        member_tags = "".join(f"<members>{m}</members>" for m in sorted(set(members)))
-        types_xml_parts.append(f"<types>{member_tags}<name>{t}</name></types>")
-    types_xml = "".join(types_xml_parts)
-    return (
-        "<?xml version=\"1.0\" encoding=\"UTF-8\"?>"
-        "<Package xmlns=\"http://soap.sforce.com/2006/04/metadata\">"
-        f"{types_xml}"
-        f"<version>{version}</version>"
-        "</Package>"
+    types_xml = "".join(
+        _PACKAGE_TYPES_TEMPLATE.format(
+            members="".join(["<members>" + m.translate(_XML_ESCAPE) + "</members>" for m in sorted(set(members))]),
+            name=t,
+        )
+        for t, members in type_to_members.items()
+        if members
     )
+    return _PACKAGE_TEMPLATE.format(types=types_xml, version=version)
 
 
-def _extract_report_fullnames_from_dashboard_xml(xml_s: str) -> List[str]:
-    # Simple and fast parse: look for <report>Folder/Name</report>
-    out: List[str] = []
-    start_tag = "<report>"
-    end_tag = "</report>"
-    i = 0
-    while True:
-        i = xml_s.find(start_tag, i)
-        if i == -1:
-            break
-        j = xml_s.find(end_tag, i)
-        if j == -1:
-            break
-        val = xml_s[i + len(start_tag) : j].strip()
-        if "/" in val:
-            out.append(val)
-        i = j + len(end_tag)
-    return sorted(set(out))
+def _extract_report_fullnames_stream(fp) -> List[str]:
+    # Stream-parse the dashboard XML and collect <report>Folder/Name</report> values
+    out: Set[str] = set()
+    for _, elem in ET.iterparse(fp, events=("end",)):
+        # Metadata XML is namespaced; match on the local tag name
+        if elem.tag.rpartition("}")[2] == "report":
+            val = (elem.text or "").strip()
+            if "/" in val:
+                out.add(val)
+        elem.clear()
+    return sorted(out)
+
 
+# Works on the raw UTF-8 bytes: the tags are ASCII and fullnames are matched whole, so the
+# dashboard never needs decoding
+_REPORT_REF_RE = re.compile(rb"<report>\s*([^<]*?)\s*</report>")
 
-def _rewrite_dashboard_report_refs(xml_s: str, rename_map: Dict[str, str]) -> str:
-    # Replace <report>oldFullName</report> with new fullName using the rename_map
-    for old_full, new_full in rename_map.items():
-        xml_s = xml_s.replace(f"<report>{old_full}</report>", f"<report>{new_full}</report>")
-    return xml_s
+
+def _rewrite_dashboard_report_refs(xml_b: bytes, rename_map: Dict[str, str]) -> bytes:
+    # Replace <report>oldFullName</report> with new fullName using the rename_map, in one pass
+    effective = {old.encode("utf-8"): new.encode("utf-8") for old, new in rename_map.items() if old != new}
+    if not effective:
+        # Nothing actually moves: skip scanning the XML at all
+        return xml_b
+
+    def repl(m: re.Match) -> bytes:
+        new_full = effective.get(m.group(1))
+        return m.group(0) if new_full is None else b"<report>" + new_full + b"</report>"
+
+    return _REPORT_REF_RE.sub(repl, xml_b)
+
+
+# Every non-alphanumeric ASCII character -> "_", applied by str.translate in one C pass
+_DEVNAME_TABLE = str.maketrans({chr(cp): "_" for cp in range(128) if not chr(cp).isalnum()})
 
 
 def _to_devname(label: str) -> str:
     # Simple normalization for DeveloperName
-    cleaned = "".join(ch if ch.isalnum() else "_" for ch in label)
+    if label.isascii():
+        cleaned = label.translate(_DEVNAME_TABLE)
+    else:
+        # The table can't know every non-ASCII symbol; classify those per character
+        cleaned = "".join(ch if ch.isalnum() else "_" for ch in label)
     cleaned = cleaned.strip("_")
     return cleaned[:80] if len(cleaned) > 80 else cleaned
 
 
-def _list_folder_items(folder_id: str, item_type: str) -> List[Dict[str, str]]:
+def _list_folder_items(
+    folder_id: str, item_type: str, limit: int | None = None, offset: int = 0
+) -> List[Dict[str, str]]:
     # SOQL-based listing by folder name to avoid Analytics 'recent' behavior
     sf = get_salesforce_client()
     _, folder_name = _get_folder_devname_by_id(folder_id)
-    safe_name = folder_name.replace("'", "\\'")
+    safe_name = _soql_str(folder_name)
+    page = ""
+    if limit is not None:
+        page += f" LIMIT {int(limit)}"
+    if offset:
+        page += f" OFFSET {int(offset)}"
     if item_type == "Report":
         soql = (
             "SELECT Id, Name, DeveloperName FROM Report WHERE FolderName = '"
             + safe_name
             + "' ORDER BY Name"
+            + page
         )
         rows = sf.sobjects.query(soql) or []
         out: List[Dict[str, str]] = []
@@ -998,6 +1326,7 @@ def _list_folder_items(folder_id: str, item_type: str) -> List[Dict[str, str]]:
             "SELECT Id, DeveloperName, Title FROM Dashboard WHERE FolderName = '"
             + safe_name
             + "' ORDER BY Title"
+            + page
         )
         rows = sf.sobjects.query(soql) or []
         out: List[Dict[str, str]] = []